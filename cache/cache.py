@@ -0,0 +1,109 @@
+"""
+Redis response cache for the task API.
+
+This module provides a small wrapper around Redis for caching rendered
+JSON responses. The cache is optional: it activates only when REDIS_URL
+is set in the environment, and every operation degrades to a no-op (or a
+cache miss) if Redis is unreachable, so request handling never depends
+on the cache being available.
+
+List responses are cached under a versioned namespace
+(tasks:list:<version>:<query-hash>); writes bump the version instead of
+scanning for keys, which invalidates every cached list in O(1).
+"""
+
+import logging
+import os
+
+from dotenv import load_dotenv
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+dotenv_path = os.path.join(os.path.dirname(__file__), "..", ".env")
+load_dotenv(dotenv_path)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Cached responses expire on their own even without explicit invalidation.
+CACHE_TTL = 30
+
+_LIST_VERSION_KEY = "tasks:list:ver"
+
+_client = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+
+
+def cache_enabled():
+    """Return True when a Redis client is configured."""
+    return _client is not None
+
+
+def cache_get(key):
+    """Fetch a cached value, treating any Redis failure as a miss.
+
+    Args:
+        key (str): Cache key.
+
+    Returns:
+        bytes | None: The cached payload, or None on miss/failure.
+    """
+    if _client is None:
+        return None
+    try:
+        return _client.get(key)
+    except redis.RedisError:
+        logger.warning("Cache read failed | key=%s", key)
+        return None
+
+
+def cache_set(key, value, ttl=CACHE_TTL):
+    """Store a payload in the cache, ignoring Redis failures.
+
+    Args:
+        key (str): Cache key.
+        value (bytes): Payload to store.
+        ttl (int): Expiry in seconds.
+    """
+    if _client is None:
+        return
+    try:
+        _client.set(key, value, ex=ttl)
+    except redis.RedisError:
+        logger.warning("Cache write failed | key=%s", key)
+
+
+def task_list_version():
+    """Return the current list-namespace version as a string.
+
+    The version is part of every list cache key, so bumping it on writes
+    orphans all previously cached lists at once.
+    """
+    if _client is None:
+        return "0"
+    try:
+        version = _client.get(_LIST_VERSION_KEY)
+        return version.decode() if version else "0"
+    except redis.RedisError:
+        logger.warning("Cache version read failed")
+        return "0"
+
+
+def invalidate_task(task_id):
+    """Invalidate cache entries affected by a write to one task.
+
+    Drops the single-task key and bumps the list namespace version so
+    stale lists are never served after a create, update or delete.
+
+    Args:
+        task_id (int): The id of the task that changed.
+    """
+    if _client is None:
+        return
+    try:
+        pipe = _client.pipeline()
+        pipe.delete(f"tasks:id:{task_id}")
+        pipe.incr(_LIST_VERSION_KEY)
+        pipe.execute()
+    except redis.RedisError:
+        logger.warning("Cache invalidation failed | id=%s", task_id)
@@ -6,8 +6,9 @@ provides database session management utilities. It loads the database URL
 from environment variables and creates the database engine and session factory.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, selectinload
+from sqlalchemy.pool import NullPool, StaticPool
 from dotenv import load_dotenv
 from contextlib import contextmanager
 
@@ -22,12 +23,49 @@ if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set.")
 
 
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # logs SQL queries
-)
-
-SessionLocal = sessionmaker(bind=engine)
+# Engine is created once at import time and shared by all requests.
+# Server databases get an explicitly sized pool with pre-ping so stale
+# connections are recycled instead of raising OperationalError
+# mid-request.
+if DATABASE_URL.startswith("sqlite"):
+    # An in-memory database lives and dies with its connection, so it
+    # must keep a single shared one (StaticPool). File-backed SQLite
+    # gets NullPool instead: concurrent requests must never share a
+    # connection, or one session's close() can commit or roll back
+    # another session's in-flight transaction.
+    in_memory = ":memory:" in DATABASE_URL or DATABASE_URL in (
+        "sqlite://",
+        "sqlite:///",
+    )
+    if in_memory:
+        engine = create_engine(
+            DATABASE_URL,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            query_cache_size=1200,
+            echo=False,  # logs SQL queries
+        )
+    else:
+        engine = create_engine(
+            DATABASE_URL,
+            poolclass=NullPool,
+            query_cache_size=1200,
+            echo=False,  # logs SQL queries
+        )
+else:
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        query_cache_size=1200,
+        echo=False,  # logs SQL queries
+    )
+
+# expire_on_commit=False keeps attributes populated after commit(), so
+# handlers can serialize a task without an extra reload SELECT.
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
 
 
 @contextmanager
@@ -51,6 +89,27 @@ def get_db():
         db.close()
 
 
+def task_query(*, loads=()):
+    """Build the base SELECT for Task with eager-load options applied.
+
+    Args:
+        loads (tuple[str]): Names of Task relationships to batch-load via
+            selectinload. Task has no relationships yet; routes that add
+            them should request the load here so related rows arrive in
+            one batched query instead of one lazy SELECT per row (N+1).
+
+    Returns:
+        Select: A select(Task) statement ready for further filtering.
+    """
+    # Imported here because db.models imports Base from this module.
+    from db.models import Task
+
+    stmt = select(Task)
+    for name in loads:
+        stmt = stmt.options(selectinload(getattr(Task, name)))
+    return stmt
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models.
 
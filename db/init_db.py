@@ -1,5 +1,25 @@
+from sqlalchemy import text
 from db.db import engine, Base
 from db.models import Task
 
 Base.metadata.create_all(engine)
+
+# Trigram indexes back the %-operator search in alltasks; pg_trgm only
+# exists on Postgres, so other dialects skip this and keep ILIKE.
+if engine.dialect.name == "postgresql":
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm "
+                "ON tasks USING gin (title gin_trgm_ops)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_tasks_desc_trgm "
+                "ON tasks USING gin (description gin_trgm_ops)"
+            )
+        )
+
 print("Tables created!")
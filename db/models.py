@@ -1,8 +1,9 @@
 from datetime import datetime, date, timezone
-from sqlalchemy import String, DateTime, Date, Enum
+from sqlalchemy import String, DateTime, Date, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from db.db import Base
 import enum
+import sys
 
 
 class TaskStatus(enum.Enum):
@@ -11,9 +12,21 @@ class TaskStatus(enum.Enum):
     done = "done"
 
 
+# value -> member lookup table, so hot paths can use STATUS_MAP.get(value)
+# instead of TaskStatus(value) with a try/except. Keys are interned so
+# lookups against interned probes short-circuit on pointer identity.
+STATUS_MAP = {sys.intern(s.value): s for s in TaskStatus}
+
+
 class Task(Base):
     __tablename__ = "tasks"
 
+    # list endpoints filter by status and sort by created_at / due_date
+    __table_args__ = (
+        Index("ix_tasks_status_created_at", "status", "created_at"),
+        Index("ix_tasks_due_date", "due_date"),
+    )
+
     # id (int, auto increment)
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -1,9 +1,15 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 
+_listener = None
+
 
 def setup_logger():
+    global _listener
+
     os.makedirs("./logs", exist_ok=True)
 
     root_logger = logging.getLogger()
@@ -24,4 +30,16 @@ def setup_logger():
     )
 
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+
+    # Request threads only enqueue records; the listener thread performs
+    # the actual file write and rotation, so logging never blocks a
+    # request on disk I/O.
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    # Stop the listener at exit so records still queued when a worker
+    # recycles are flushed to disk instead of dying with the daemon
+    # thread.
+    _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -0,0 +1,496 @@
+"""
+Task routes blueprint.
+
+All task API endpoints and the frontend pages live on this blueprint so
+the app factory registers them exactly once; optimizations to a route
+apply in one place instead of drifting across copies of the app module.
+"""
+
+import logging
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    request,
+    render_template,
+    jsonify,
+    stream_with_context,
+)
+import orjson
+from db.db import get_db, engine, task_query
+from db.models import Task, TaskStatus, STATUS_MAP
+from datetime import date, datetime
+from sqlalchemy import (
+    insert,
+    select,
+    update,
+    delete,
+    func,
+    or_,
+    asc,
+    desc,
+    tuple_,
+    bindparam,
+)
+from validation.validate import TASK_ADAPTER
+from pydantic import ValidationError
+from cache.cache import (
+    cache_enabled,
+    cache_get,
+    cache_set,
+    task_list_version,
+    invalidate_task,
+)
+import hashlib
+
+logger = logging.getLogger(__name__)
+
+tasks_bp = Blueprint("tasks", __name__)
+
+# On Postgres the %-operator similarity search can use the pg_trgm GIN
+# indexes created by init_db; other dialects keep the ILIKE scan.
+USE_TRGM_SEARCH = engine.dialect.name == "postgresql"
+
+# Read-only list endpoints select these columns directly instead of
+# select(Task), skipping per-row ORM hydration and identity-map work.
+TASK_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.created_at,
+    Task.due_date,
+)
+
+# Tasks without a due date sort as this far-future sentinel, so the
+# keyset comparison sees every row; a bare NULL compares as unknown and
+# silently drops undated tasks out of paginated results.
+DUE_DATE_SENTINEL = date.max
+
+# By-id statements are constructed once at import and executed with bound
+# parameters, so per-request work is a cache hit instead of a recompile.
+TASK_BY_ID = task_query().where(Task.id == bindparam("id"))
+DELETE_BY_ID = delete(Task).where(Task.id == bindparam("id"))
+
+# The hot list page template is compiled on first use and rendered
+# directly, bypassing the per-call template lookup in render_template.
+_list_template = None
+
+
+def _get_list_template():
+    global _list_template
+    if _list_template is None:
+        _list_template = current_app.jinja_env.get_template("task/tasks_list.html")
+    return _list_template
+
+
+@tasks_bp.get("/api/v1/tasks/<int:id>")
+def show_task(id):
+    """Retrieve a single task by its ID.
+
+    Args:
+        id (int): The unique identifier of the task.
+
+    Returns:
+        dict: Task data as a dictionary, or error response with 404 status if not found.
+    """
+    cache_key = f"tasks:id:{id}"
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
+    with get_db() as db:
+        task = db.execute(TASK_BY_ID, {"id": id}).scalar_one_or_none()
+        if not task:
+            logger.error("Task not found | id=%s", id)
+            return {"error": "Task not found"}, 404
+        payload = orjson.dumps(task_to_dict(task))
+        cache_set(cache_key, payload)
+        return Response(payload, mimetype="application/json")
+
+
+@tasks_bp.get("/api/v1/tasks")
+def alltasks():
+    """Retrieve all tasks with optional filtering and sorting.
+
+    Query Parameters:
+        q (str): Search query to filter tasks by title or description.
+        status (str): Filter tasks by status.
+        sort (str): Field to sort by (default: 'created_at').
+        order (str): Sort order 'asc' or 'desc' (default: 'asc').
+        limit (int): Maximum number of tasks per page (default: 50, max: 200).
+        cursor (str): Opaque cursor from a previous page's 'next_cursor'.
+
+    Returns:
+        dict: {'items': [...], 'next_cursor': ...} where next_cursor is
+              None when there are no further pages.
+    """
+    q = request.args.get("q", "").strip()
+    status = request.args.get("status", "").strip()
+    sort_by = request.args.get("sort", "created_at").strip()
+    order = request.args.get("order", "asc").lower()
+    cursor = request.args.get("cursor", "").strip()
+
+    try:
+        # Clamp below as well as above: a zero/negative LIMIT is "no
+        # limit" on SQLite and an error on Postgres.
+        limit = max(1, min(int(request.args.get("limit", 50)), 200))
+    except ValueError:
+        logger.error("Invalid limit value")
+        return {"error": "invalid limit value"}, 400
+
+    # Identical (q, status, sort, order, limit, cursor) tuples serve the
+    # same payload from Redis; writes bump the namespace version.
+    cache_key = (
+        "tasks:list:"
+        + task_list_version()
+        + ":"
+        + hashlib.md5(request.query_string).hexdigest()
+    )
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return Response(cached, mimetype="application/json")
+
+    stmt = select(*TASK_COLUMNS)
+
+    if q:
+        if USE_TRGM_SEARCH:
+            stmt = stmt.where(or_(Task.title.op("%")(q), Task.description.op("%")(q)))
+        else:
+            stmt = stmt.where(
+                or_(Task.title.ilike(f"%{q}%"), Task.description.ilike(f"%{q}%"))
+            )
+
+    if status:
+        status_member = STATUS_MAP.get(status)
+        if status_member is None:
+            logger.error("Invalid task status")
+            return {"error": "invalid status value"}, 404
+        stmt = stmt.where(Task.status == status_member)
+
+    sort_column = (
+        Task.created_at
+        if sort_by == "created_at"
+        else func.coalesce(Task.due_date, DUE_DATE_SENTINEL)
+    )
+
+    # Keyset pagination on (sort_column, id): the cursor is the sort
+    # value and id of the last row of the previous page, so each page
+    # seeks directly instead of scanning an ever-growing OFFSET.
+    if cursor:
+        try:
+            cursor_value, cursor_id = cursor.rsplit(",", 1)
+            cursor_id = int(cursor_id)
+            cursor_value = (
+                datetime.fromisoformat(cursor_value)
+                if sort_by == "created_at"
+                else date.fromisoformat(cursor_value)
+            )
+        except ValueError:
+            logger.error("Invalid cursor value")
+            return {"error": "invalid cursor value"}, 400
+        key = tuple_(sort_column, Task.id)
+        stmt = stmt.where(
+            key < (cursor_value, cursor_id)
+            if order == "desc"
+            else key > (cursor_value, cursor_id)
+        )
+
+    stmt = stmt.order_by(
+        *(
+            (desc(sort_column), desc(Task.id))
+            if order == "desc"
+            else (asc(sort_column), asc(Task.id))
+        )
+    ).limit(limit)
+
+    def stream():
+        """Serialize rows as they arrive so the response starts flowing
+        before the last row has been fetched, and peak memory stays at
+        one fetch batch instead of the whole page."""
+        chunks = [] if cache_enabled() else None
+
+        def emit(chunk):
+            if chunks is not None:
+                chunks.append(chunk)
+            return chunk
+
+        with get_db() as db:
+            rows = db.execute(stmt, execution_options={"yield_per": 100})
+
+            yield emit(b'{"items": [')
+            count = 0
+            last = None
+            for t in rows:
+                yield emit((b"," if count else b"") + orjson.dumps(task_to_dict(t)))
+                last = t
+                count += 1
+
+            next_cursor = None
+            if count == limit and last is not None:
+                last_value = (
+                    last.created_at
+                    if sort_by == "created_at"
+                    else (last.due_date or DUE_DATE_SENTINEL)
+                )
+                next_cursor = f"{last_value.isoformat()},{last.id}"
+
+            yield emit(b'], "next_cursor": ' + orjson.dumps(next_cursor) + b"}")
+
+        if chunks is not None:
+            cache_set(cache_key, b"".join(chunks))
+
+    return Response(stream_with_context(stream()), mimetype="application/json")
+
+
+@tasks_bp.post("/api/v1/tasks")
+def create_task():
+    """Create a new task."""
+    try:
+        # validate_python hits the compiled validator directly on the
+        # parsed dict and emits a plain dict, with no model allocation.
+        validated = TASK_ADAPTER.validate_python(request.get_json(silent=True) or {})
+    except ValidationError as e:
+        logger.warning(
+            "Validation error while creating task: %s", e.errors()[0].get("msg")
+        )
+        return jsonify({"errors": e.errors()[0].get("msg")}), 400
+
+    task = Task(
+        title=validated["title"],
+        description=validated.get("description"),
+        status=validated.get("status", TaskStatus.todo),
+        due_date=validated.get("due_date"),
+    )
+
+    with get_db() as db:
+        db.add(task)
+        db.commit()
+
+    invalidate_task(task.id)
+
+    # Log all non-None properties
+    task_data = {
+        k: (v.isoformat() if isinstance(v, date) else v)
+        for k, v in {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status.value,
+            "due_date": task.due_date,
+            "created_at": task.created_at,
+        }.items()
+        if v is not None
+    }
+
+    logger.info("Task created successfully | %s", task_data)
+    return task_data, 201
+
+
+@tasks_bp.post("/api/v1/tasks:bulk")
+def create_tasks_bulk():
+    """Create many tasks in a single INSERT.
+
+    Request JSON Body:
+        list: Array of task objects with the same fields as POST /tasks.
+
+    Returns:
+        tuple: List of created task dictionaries and 201 status code, or
+               error response with 400 status code on invalid input.
+    """
+    payload = request.get_json(silent=True)
+
+    if not isinstance(payload, list) or not payload:
+        logger.error("Bulk create | expected a non-empty array")
+        return {"error": "expected a non-empty JSON array"}, 400
+
+    try:
+        validated = [TASK_ADAPTER.validate_python(item or {}) for item in payload]
+    except ValidationError as e:
+        logger.warning(
+            "Validation error while bulk creating tasks: %s", e.errors()[0].get("msg")
+        )
+        return jsonify({"errors": e.errors()[0].get("msg")}), 400
+
+    rows = [
+        {
+            "title": v["title"],
+            "description": v.get("description"),
+            "status": v.get("status", TaskStatus.todo),
+            "due_date": v.get("due_date"),
+        }
+        for v in validated
+    ]
+
+    # One INSERT..RETURNING for the whole batch (insertmanyvalues), one
+    # transaction — instead of a session, commit and round trip per task.
+    # sort_by_parameter_order keeps the RETURNING rows aligned with the
+    # request array, which the response contract relies on.
+    with get_db() as db:
+        created = (
+            db.execute(
+                insert(Task).returning(Task, sort_by_parameter_order=True), rows
+            )
+            .scalars()
+            .all()
+        )
+        db.commit()
+
+    invalidate_task(created[-1].id)
+    logger.info("Tasks bulk created successfully | count=%s", len(created))
+    return [task_to_dict(t) for t in created], 201
+
+
+@tasks_bp.patch("/api/v1/tasks/<int:task_id>")
+def update_task(task_id):
+    """Update an existing task.
+
+    Args:
+        task_id (int): The unique identifier of the task to update.
+
+    Request JSON Body:
+        title (str, optional): Updated task title.
+        description (str, optional): Updated task description.
+        status (str, optional): Updated task status.
+        due_date (str, optional): Updated due date in ISO format.
+
+    Returns:
+        tuple: Updated task data dictionary and 200 status code on success,
+               or error response with 400/404 status code on failure.
+    """
+    data = request.get_json()
+
+    if not data:
+        logger.error("Updating tasks | No data provided")
+        return {"error": "no data provided"}, 400
+
+    # Validate the patch up front so the database sees one UPDATE..RETURNING
+    # instead of SELECT -> mutate -> COMMIT round trips.
+    patch = {}
+
+    if "title" in data:
+        patch["title"] = data["title"]
+
+    if "description" in data:
+        patch["description"] = data["description"]
+
+    if "status" in data:
+        # Raw PATCH bodies are unvalidated, so the status may not even be
+        # a string; non-str values (unhashable ones would break .get) are
+        # just invalid.
+        status_member = (
+            STATUS_MAP.get(data["status"]) if isinstance(data["status"], str) else None
+        )
+        if status_member is None:
+            logger.error("Update task failed | id=%s", task_id)
+            return {"error": "invalid status"}, 400
+        patch["status"] = status_member
+
+    if "due_date" in data:
+        patch["due_date"] = (
+            date.fromisoformat(data["due_date"]) if data["due_date"] else None
+        )
+
+    with get_db() as db:
+        if not patch:
+            # Nothing recognized to update; just return the current row.
+            task = db.execute(TASK_BY_ID, {"id": task_id}).scalar_one_or_none()
+        else:
+            task = db.execute(
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**patch)
+                .returning(Task),
+                execution_options={"synchronize_session": False},
+            ).scalar_one_or_none()
+
+        if task is None:
+            logger.error("task not found for id = %s", task_id)
+            return {"error": "task not found"}, 400
+
+        logger.info("Task updated successfully | id=%s", task_id)
+        db.commit()
+
+        invalidate_task(task_id)
+        return task_to_dict(task), 200
+
+
+def task_to_dict(task):
+    """Convert a Task object or column Row to a dictionary.
+
+    Args:
+        task (Task | Row): A Task instance or a TASK_COLUMNS result row;
+            both expose the task fields as attributes.
+
+    Returns:
+        dict: Dictionary representation of the task with all fields
+              including id, title, description, status, created_at, and due_date.
+              Dates and the status enum are left raw; orjson serializes them.
+    """
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "created_at": task.created_at,
+        "due_date": task.due_date,
+    }
+
+
+@tasks_bp.delete("/api/v1/tasks/<int:id>")
+def delete_task(id):
+    """Delete a task by its ID.
+
+    Args:
+        id (int): The unique identifier of the task to delete.
+
+    Returns:
+        tuple: Success message and 200 status code on successful deletion,
+               or error response with 404 status code if task not found.
+    """
+    with get_db() as db:
+        result = db.execute(DELETE_BY_ID, {"id": id})
+        db.commit()
+
+        if result.rowcount == 0:
+            logger.error("deletion; non existing id =%s", id)
+            return {"error": "Non-existing id"}, 404
+
+    invalidate_task(id)
+    logger.info("Task created successfully | id=%s", id)
+    return {"message": "Task deleted"}, 200
+
+
+# Frontend routes
+@tasks_bp.get("/")
+def home():
+    """Render the home page.
+
+    Returns:
+        str: Rendered HTML template for the home/index page.
+    """
+    return render_template("task/index.html")
+
+
+@tasks_bp.get("/tasks")
+def tasks():
+    """Render the tasks list page with all tasks.
+
+    Returns:
+        str: Rendered HTML template displaying all tasks.
+    """
+    try:
+        limit = max(1, min(int(request.args.get("limit", 50)), 200))
+    except ValueError:
+        limit = 50
+
+    with get_db() as db:
+        stmt = (
+            select(*TASK_COLUMNS)
+            .order_by(asc(Task.created_at), asc(Task.id))
+            .limit(limit)
+        )
+        # Jinja iterates the result lazily; render inside the session so
+        # rows stream through the template instead of being listed first.
+        tasks = db.execute(stmt, execution_options={"yield_per": 100})
+        return _get_list_template().render(tasks=tasks)
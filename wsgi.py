@@ -0,0 +1,24 @@
+"""
+WSGI entry point for production deployments.
+
+Run under gunicorn with gevent workers so each worker serves many
+in-flight requests concurrently instead of one at a time — the handlers
+are I/O-bound on the database and cache, so cooperative greenlets let a
+worker keep working while another request waits on a socket:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 wsgi:app
+
+The monkey patch must run before anything else imports the socket and
+ssl modules, which is why it sits at the very top of this file.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+from app import create_app  # noqa: E402
+
+app = create_app()
+
+if __name__ == "__main__":
+    app.run()